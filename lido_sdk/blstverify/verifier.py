@@ -1,4 +1,7 @@
-from .blst import PT, Pairing, P1_Affine, P2_Affine, BLST_SUCCESS
+import secrets
+from typing import List, Optional, Tuple
+
+from .blst import Pairing, P1, P1_Affine, P2, P2_Affine, PT
 
 HASH_OR_ENCODE = True
 DST = "BLS_SIG_BLS12381G2_XMD:SHA-256_SSWU_RO_POP_"
@@ -17,14 +20,78 @@ def verify(pubkey: bytes, message: bytes, signature: bytes) -> bool:
         pk_affine = P1_Affine(pubkey)
         sig_affine = P2_Affine(signature)
 
-        ctx = Pairing(HASH_OR_ENCODE, DST)
-        result = ctx.aggregate(pk_affine, sig_affine, message)
-        if result != BLST_SUCCESS:
-            return False
+        # Group checks, hashing to curve and pairing are done in one call inside blst.
+        # Any error (including failed verification) is raised as ValueError.
+        sig_affine.core_verify(pk_affine, HASH_OR_ENCODE, message, DST.encode())
+
+        return True
+    except (RuntimeError, ValueError):
+        return False
+
 
-        ctx.commit()
-        gtsig = PT(sig_affine)
+def decode_key(
+    pubkey: bytes, signature: bytes
+) -> Optional[Tuple[P1_Affine, P2_Affine]]:
+    """
+    Decompress pubkey and signature and check that both points are in their groups.
 
-        return ctx.finalverify(gtsig)
+    @return: Pair of points or None if any of them is invalid.
+    """
+    if (not isinstance(pubkey, VALID_TYPES)) or (
+        not isinstance(signature, VALID_TYPES)
+    ):
+        return None
+
+    try:
+        pk_affine = P1_Affine(pubkey)
+        sig_affine = P2_Affine(signature)
     except RuntimeError:
-        return False
+        return None
+
+    if pk_affine.is_inf() or not pk_affine.in_group() or not sig_affine.in_group():
+        return None
+
+    return pk_affine, sig_affine
+
+
+def hash_message(message: bytes) -> P2_Affine:
+    """Hash message to G2. It is the most expensive part of verification, so it should be done once per message."""
+    return P2().hash_to(message, DST.encode()).to_affine()
+
+
+def verify_decoded(key: Tuple[P1_Affine, P2_Affine], message_point: P2_Affine) -> bool:
+    """Verify one signature using points prepared by decode_key and hash_message."""
+    pk_affine, sig_affine = key
+
+    ctx = Pairing(HASH_OR_ENCODE, DST)
+    ctx.raw_aggregate(message_point, pk_affine)
+    ctx.commit()
+
+    return ctx.finalverify(PT(sig_affine))
+
+
+def verify_decoded_batch(
+    keys: List[Tuple[P1_Affine, P2_Affine]], message_points: List[P2_Affine]
+) -> bool:
+    """
+    Verifies all prepared (key, message) pairs with a single final exponentiation.
+    Each pair is multiplied by a random 64-bit scalar, so invalid signatures can't cancel each other out.
+
+    @return: True only if every signature in the batch is valid.
+    """
+    if not keys:
+        return True
+
+    ctx = Pairing(HASH_OR_ENCODE, DST)
+    signatures_sum = P2()
+
+    for (pk_affine, sig_affine), message_point in zip(keys, message_points):
+        scalar = (secrets.randbits(64) | 1).to_bytes(8, "little")
+
+        ctx.raw_aggregate(message_point, P1(pk_affine).mult(scalar).to_affine())
+        signatures_sum.add(P2(sig_affine).mult(scalar))
+
+    ctx.commit()
+
+    return ctx.finalverify(PT(signatures_sum.to_affine()))
+
@@ -1,6 +1,13 @@
+import os
+
 # Multicall default settings settings
 MULTICALL_MAX_BUNCH: int = 275
 MULTICALL_MAX_WORKERS: int = 6
 MULTICALL_MAX_RETRIES: int = 5
 MULTICALL_POOL_EXECUTOR_TIMEOUT: int = 30
 VALIDATE_POOL_EXECUTOR_TIMEOUT: int = 100
+VALIDATE_POOL_MAX_WORKERS: int = int(
+    os.getenv("LIDO_VALIDATE_WORKERS", os.cpu_count() or 1)
+)
+VALIDATE_MIN_KEYS_FOR_POOL: int = 100
+VALIDATE_BATCH_SIZE: int = 64
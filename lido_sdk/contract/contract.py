@@ -1,5 +1,6 @@
 from typing import Dict, List, Optional
 
+from multicall import Call
 from web3 import Web3
 
 
@@ -17,6 +18,9 @@ class Contract:
         LidoContract.{contractMethodName}(web3, args0)
         LidoContract.{contractMethodName}(web3, args1)
         ...
+
+        Calls to different methods can be sent in one multicall as well
+        execute_multicall(web3, [LidoContract.create_call(web3, "isStopped"), ...])
     """
 
     def __init__(self, registry_addresses: Dict[int, str], contract_abi: List[Dict]):
@@ -29,6 +33,7 @@ class Contract:
         """
         self.registry_addresses = registry_addresses
         self.contract_abi = contract_abi
+        self._abi_functions = {}
 
         for abi_element in contract_abi:
             if abi_element["type"] == "function":
@@ -36,6 +41,7 @@ class Contract:
 
     def _create_contract_method(self, abi_function):
         """Create all methods announced in contract's abi"""
+        self._abi_functions[abi_function["name"]] = abi_function
 
         def call(w3: Web3, args: Optional[List] = None):
             from lido_sdk.contract.execute_contract import execute_contract_call
@@ -65,3 +71,20 @@ class Contract:
 
         setattr(self, abi_function["name"], call)
         setattr(self, f"{abi_function['name']}_multicall", multicall)
+
+    def create_call(
+        self, w3: Web3, method_name: str, args: Optional[List] = None
+    ) -> Call:
+        """Create contract method call without executing it, so it can be sent in multicall with other calls."""
+        from lido_sdk.contract.execute_contract import create_contract_call
+
+        abi_function = self._abi_functions[method_name]
+
+        return create_contract_call(
+            w3,
+            self.registry_addresses[w3.eth.chain_id],
+            abi_function["name"],
+            abi_function["inputs"],
+            abi_function["outputs"],
+            args=args,
+        )
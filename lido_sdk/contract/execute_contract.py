@@ -23,15 +23,24 @@ def execute_contract_multicall(
     @param args_list: List of bunches of arg each of those will be used to call contract, exp: [[True, 1], [True, 2], ...]
     @return: List of results from each call that we did.
     """
-    return Multicall(
-        calls=[
-            _create_contract_call(
+    return execute_multicall(
+        w3,
+        [
+            create_contract_call(
                 w3, registry_address, abi_method_name, abi_input, abi_returns, args
             )
             for args in args_list
         ],
-        _w3=w3,
-    )()
+    )
+
+
+def execute_multicall(w3: Web3, calls: List[Call]) -> List:
+    """
+    @param w3: Web3 instance
+    @param calls: Calls to any contracts and methods, exp: created by Contract.create_call
+    @return: List of results in the same order as calls.
+    """
+    return Multicall(calls=calls, _w3=w3)()
 
 
 def execute_contract_call(
@@ -51,12 +60,12 @@ def execute_contract_call(
     @param args: List of arguments that will be used to call this function
     @return: List of results from each call that we did.
     """
-    return _create_contract_call(
+    return create_contract_call(
         w3, registry_address, abi_method_name, abi_input, abi_returns, args
     )()
 
 
-def _create_contract_call(
+def create_contract_call(
     w3: Web3,
     registry_address: str,
     abi_method_name: str,
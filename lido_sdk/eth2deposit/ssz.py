@@ -1,3 +1,5 @@
+from hashlib import sha256
+
 from ssz import (
     Serializable,
     uint64,
@@ -75,3 +77,40 @@ def compute_signing_root(ssz_object: Serializable, domain: bytes) -> bytes:
         domain=domain,
     )
     return domain_wrapped_object.hash_tree_root
+
+
+def compute_deposit_amount_root(amount: int) -> bytes:
+    """
+    Return the root of the right DepositMessage subtree: (amount, zero padding leaf).
+    It doesn't depend on the key, so it can be computed once for all deposits with the same amount.
+    """
+    return sha256(amount.to_bytes(32, "little") + ZERO_BYTES32).digest()
+
+
+def compute_deposit_signing_root(
+    pubkey: bytes,
+    withdrawal_credentials: bytes,
+    amount_root: bytes,
+    domain: bytes,
+) -> bytes:
+    """
+    Same as `compute_signing_root(DepositMessage(...), domain)`, but merkleization is done directly with sha256.
+    It skips building ssz objects for each key.
+
+    @param amount_root: Result of `compute_deposit_amount_root`.
+    """
+    if len(pubkey) != 48:
+        raise ValueError(f"Pubkey should be in 48 bytes. Got {len(pubkey)}.")
+    if len(withdrawal_credentials) != 32:
+        raise ValueError(
+            f"Withdrawal credentials should be in 32 bytes. Got {len(withdrawal_credentials)}."
+        )
+    if len(domain) != 32:
+        raise ValueError(f"Domain should be in 32 bytes. Got {len(domain)}.")
+
+    # hashlib.sha256 is backed by OpenSSL, which already uses SHA-NI / ARMv8 SHA instructions when CPU has them
+    pubkey_root = sha256(bytes(pubkey) + ZERO_BYTES32[:16]).digest()
+    left_root = sha256(pubkey_root + withdrawal_credentials).digest()
+    deposit_message_root = sha256(left_root + amount_root).digest()
+
+    return sha256(deposit_message_root + domain).digest()
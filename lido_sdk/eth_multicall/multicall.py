@@ -12,6 +12,7 @@ class Multicall(DefaultMulticall):
 
     Improves:
         - Added MAX_CALLS_PER_MULTICALL param to avoid huge and slow batches in Multicall
+        - Uses Multicall3 `aggregate3` method
         - results from multicall is not a dict, but a list now. We are making a lot of requests to one contract's method,
         so we don't wanna loose data.
     """
@@ -46,26 +47,26 @@ class Multicall(DefaultMulticall):
     def execute(self, contract_calls):
         aggregate = Call(
             MULTICALL_ADDRESSES[self.w3.eth.chain_id],
-            "aggregate((address,bytes)[])(uint256,bytes[])",
+            "aggregate3((address,bool,bytes)[])((bool,bytes)[])",
             returns=None,
             _w3=self.w3,
             block_id=self.block_id,
         )
 
-        args = [[[call.target, call.data] for call in contract_calls]]
+        # allowFailure is False, so any failed call reverts the whole aggregate3 call
+        args = [[[call.target, False, call.data] for call in contract_calls]]
 
         for retry_num in range(self.max_retries):
             try:
-                block, outputs = aggregate(args)
+                outputs = aggregate(args)
             except ValueError as error:
                 if retry_num == self.max_retries - 1:
                     raise error
             else:
-                results = []
-                for call, output in zip(contract_calls, outputs):
-                    results.append(call.decode_output(output))
-
-                return results
+                return [
+                    call.decode_output(output)
+                    for call, (_, output) in zip(contract_calls, outputs)
+                ]
 
         # Not expected exception
         raise Exception("Bug in Multicall")
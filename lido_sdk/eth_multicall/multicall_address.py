@@ -1,8 +1,9 @@
 from lido_sdk.network import Network
 
 
+# Multicall3 has the same address in every network
 MULTICALL_ADDRESSES = {
-    Network.Mainnet: "0xeefBa1e63905eF1D7ACbA5a8513c70307C1cE441",
-    Network.Görli: "0x77dCa2C955b15e9dE4dbBCf1246B4B85b651e50e",
-    Network.Holesky: "0x34cA8B8879C3578FBcDd50D88ECc29eDdBEDE0fD",
+    Network.Mainnet: "0xcA11bde05977b3631167028862bE2a173976CA11",
+    Network.Görli: "0xcA11bde05977b3631167028862bE2a173976CA11",
+    Network.Holesky: "0xcA11bde05977b3631167028862bE2a173976CA11",
 }
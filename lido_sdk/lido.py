@@ -1,5 +1,4 @@
-import copy
-from typing import List, Optional, Tuple, Dict
+from typing import List, Optional, Set, Tuple, Dict
 
 from web3 import Web3
 
@@ -10,7 +9,9 @@ from lido_sdk.methods import (
     get_operators_indexes,
     get_operators_data,
     get_operators_keys,
+    get_keys_op_index,
     get_status,
+    get_withdrawal_credentials,
 )
 from lido_sdk.methods.operators import get_keys_by_indexes
 from lido_sdk.methods.typing import Operator, OperatorKey
@@ -24,6 +25,8 @@ class Lido:
     operators_indexes = None
     operators = None
     keys = None
+    keys_op_index = None
+    withdrawal_credentials = None
 
     def __init__(self, w3: Web3, **kwargs):
         self._w3 = w3
@@ -81,10 +84,30 @@ class Lido:
                 "`get_operators_data` should be called first or provide `operators` param"
             )
 
+        # Nonce is fetched before keys, so any change made during fetch will be noticed by update_keys
+        self.keys_op_index = get_keys_op_index(self._w3)
         self.keys = get_operators_keys(self._w3, operators)
 
         return self.keys
 
+    def get_withdrawal_credentials(self, fresh: bool = False) -> bytes:
+        """
+        Withdrawal credentials are changed very rarely, so they are cached in Lido object.
+
+        @param fresh: Ignore cached value and fetch credentials from contract.
+        @return: Actual withdrawal credentials.
+        """
+        if fresh or self.withdrawal_credentials is None:
+            self.withdrawal_credentials = get_withdrawal_credentials(self._w3)
+
+        return self.withdrawal_credentials
+
+    def clear_cache(self):
+        """
+        Drops cached values, they will be fetched again on next request.
+        """
+        self.withdrawal_credentials = None
+
     def update_keys(self) -> List[OperatorKey]:
         """
         All keys in Lido object will be updated in optimal way.
@@ -95,32 +118,77 @@ class Lido:
         if self.keys is None:
             raise LidoException("`get_operators_keys` should be called first")
 
+        self.clear_cache()
+        keys_op_index = get_keys_op_index(self._w3)
         self.get_operators_indexes()
-        old_operators = copy.deepcopy(self.operators)
+        # Operator's fields are immutable values, so shallow copy of each dict is enough
+        old_operators = [{**operator} for operator in self.operators]
         self.get_operators_data()
 
-        key_args = self._get_key_args_to_call(old_operators, self.operators)
+        # Remove and add of a key keeps operator's counters the same, so they can be trusted only if nonce is the same
+        if keys_op_index == self.keys_op_index:
+            unchanged_operators = self._get_unchanged_operators(
+                old_operators, self.operators
+            )
+        else:
+            unchanged_operators = set()
+        key_args = self._get_key_args_to_call(
+            old_operators, self.operators, unchanged_operators
+        )
 
         keys = get_keys_by_indexes(self._w3, key_args)
 
-        self.keys = self._merge_keys(self.keys, keys)
+        self.keys = self._merge_keys(self.keys, keys, unchanged_operators)
+        self.keys_op_index = keys_op_index
 
         return self.keys
 
     @staticmethod
-    def _get_key_args_to_call(
+    def _get_unchanged_operators(
         old_operators: List[Operator], new_operators: List[Operator]
+    ) -> Set[int]:
+        """
+        Operators with the same total and used keys count as before. Their keys are not refetched.
+        """
+        old_operators_by_index = {
+            operator["index"]: operator for operator in old_operators
+        }
+
+        unchanged_operators = set()
+
+        for operator in new_operators:
+            prev_op_state = old_operators_by_index.get(operator["index"])
+
+            if (
+                prev_op_state
+                and prev_op_state["totalSigningKeys"] == operator["totalSigningKeys"]
+                and prev_op_state["usedSigningKeys"] == operator["usedSigningKeys"]
+            ):
+                unchanged_operators.add(operator["index"])
+
+        return unchanged_operators
+
+    @staticmethod
+    def _get_key_args_to_call(
+        old_operators: List[Operator],
+        new_operators: List[Operator],
+        unchanged_operators: Set[int],
     ) -> List[Tuple[int, int]]:
         """
         Check diff between previous operators and new operator's update and generate args for multicall to fetch new
         and old unused keys.
         """
+        old_operators_by_index = {
+            operator["index"]: operator for operator in old_operators
+        }
+
         key_args = []
 
         for operator in new_operators:
-            prev_op_state = next(
-                op for op in old_operators if op["index"] == operator["index"]
-            )
+            if operator["index"] in unchanged_operators:
+                continue
+
+            prev_op_state = old_operators_by_index.get(operator["index"])
 
             if prev_op_state:
                 start_index_keys = prev_op_state["usedSigningKeys"]
@@ -134,7 +202,9 @@ class Lido:
 
     @staticmethod
     def _merge_keys(
-        old_keys: List[OperatorKey], new_keys: List[OperatorKey]
+        old_keys: List[OperatorKey],
+        new_keys: List[OperatorKey],
+        unchanged_operators: Set[int],
     ) -> List[OperatorKey]:
         """
         Merge keys from last request with old one.
@@ -143,42 +213,35 @@ class Lido:
         If only old key exists - seems it was deleted or used.
             if it was used we should leave it in list
             if it wasn't used we should remove it, because it was deleted recently.
+        Keys of unchanged operators weren't refetched, so they are left as is.
         """
+        # Index new keys by position, so merge is linear instead of scanning list for each key
+        new_keys_by_position = {
+            (key["operator_index"], key["index"]): key for key in new_keys
+        }
+        merged_positions = set()
+
         updated_keys = []
 
         for old_key in old_keys:
-            new_key = Lido._find_key(
-                old_key["index"], old_key["operator_index"], new_keys
-            )
+            position = (old_key["operator_index"], old_key["index"])
+            new_key = new_keys_by_position.get(position)
 
             if new_key:
                 updated_keys.append(new_key)
-            elif old_key["used"]:
+                merged_positions.add(position)
+            elif old_key["used"] or old_key["operator_index"] in unchanged_operators:
                 updated_keys.append(old_key)
 
         for new_key in new_keys:
-            key = Lido._find_key(
-                new_key["index"], new_key["operator_index"], updated_keys
-            )
+            position = (new_key["operator_index"], new_key["index"])
 
-            if not key:
+            if position not in merged_positions:
                 updated_keys.append(new_key)
+                merged_positions.add(position)
 
         return updated_keys
 
-    @staticmethod
-    def _find_key(
-        index: int, operator_index: int, keys: List[OperatorKey]
-    ) -> Optional[OperatorKey]:
-        return next(
-            (
-                key
-                for key in keys
-                if key["index"] == index and key["operator_index"] == operator_index
-            ),
-            None,
-        )
-
     def validate_keys(
         self, keys: Optional[List[OperatorKey]] = None
     ) -> List[OperatorKey]:
@@ -194,7 +257,7 @@ class Lido:
                 "`get_operators_keys` should be called first or provide `keys` param"
             )
 
-        return validate_keys(self._w3, keys)
+        return validate_keys(self._w3, keys, self.get_withdrawal_credentials())
 
     def find_duplicated_keys(
         self, keys: Optional[List[OperatorKey]] = None
@@ -227,6 +290,7 @@ class Lido:
         - invalid_keys - for details see Lido.validate_keys method.
         - duplicated_keys - for details see Lido.find_duplicated_keys method.
         """
+        self.clear_cache()
         self.get_operators_indexes()
         self.get_operators_data()
         self.get_operators_keys()
@@ -1,7 +1,14 @@
-from lido_sdk.methods.keys import find_duplicated_keys, validate_keys, validate_key
+from lido_sdk.methods.keys import (
+    find_duplicated_keys,
+    find_duplicated_keys_groups,
+    validate_keys,
+    validate_key,
+    get_withdrawal_credentials,
+)
 from lido_sdk.methods.operators import (
     get_operators_indexes,
     get_operators_data,
     get_operators_keys,
+    get_keys_op_index,
 )
 from lido_sdk.methods.stats import get_status
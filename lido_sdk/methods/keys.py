@@ -1,18 +1,39 @@
+from collections import Counter, defaultdict
 from concurrent.futures import ProcessPoolExecutor
-from typing import List, Tuple
+from functools import partial
+from itertools import chain
+from operator import itemgetter
+from typing import Dict, Hashable, List, Optional, Set, Tuple
 
 from lido_sdk import config
 from lido_sdk.eth2deposit.ssz import (
     compute_deposit_domain,
-    DepositMessage,
-    compute_signing_root,
+    compute_deposit_amount_root,
+    compute_deposit_signing_root,
 )
 from web3 import Web3
 
 from lido_sdk.contract import LidoContract
 from lido_sdk.methods.typing import OperatorKey
 from lido_sdk.network.type import WITHDRAWAL_CREDENTIALS, GENESIS_FORK_VERSION
-from lido_sdk.blstverify.verifier import verify
+from lido_sdk.blstverify.verifier import (
+    decode_key,
+    hash_message,
+    verify,
+    verify_decoded,
+    verify_decoded_batch,
+    VALID_TYPES,
+)
+
+
+ETH32 = 32 * 10**9
+ETH32_ROOT = compute_deposit_amount_root(ETH32)
+PUBKEY_LENGTH = 48
+SIGNATURE_LENGTH = 96
+# Ranges of this size are checked key by key instead of further bisection
+BISECT_MIN_SIZE = 4
+# Keys are checked one by one while more than 1 of DENSE_FAILURES_RATIO checked keys is invalid
+DENSE_FAILURES_RATIO = 8
 
 
 def find_duplicated_keys(
@@ -24,18 +45,43 @@ def find_duplicated_keys(
     @param keys: List of keys
     @return: Returns list of pair keys (key_1, key_2) that are duplicating
     """
-    keys_dict = {}
     duplicates = []
 
-    for key in keys:
-        if key["key"] not in keys_dict:
-            keys_dict[key["key"]] = key
-        else:
-            duplicates.append((keys_dict[key["key"]], key))
+    # Each duplicate is paired with first key in group, so result is linear to group size
+    for group in find_duplicated_keys_groups(keys):
+        for duplicate in group[1:]:
+            duplicates.append((group[0], duplicate))
 
     return duplicates
 
 
+def find_duplicated_keys_groups(
+    keys: List[OperatorKey],
+) -> List[List[OperatorKey]]:
+    """
+    Find all duplicates in list of keys
+
+    @param keys: List of keys
+    @return: Returns list of groups. Each group contains all keys with the same pubkey in original order.
+    """
+    if not keys:
+        return []
+
+    # Counting is done in C, so in common case (no duplicates) we don't build any groups
+    keys_count = Counter(map(itemgetter("key"), keys))
+
+    if len(keys_count) == len(keys):
+        return []
+
+    keys_groups = defaultdict(list)
+
+    for key in keys:
+        if keys_count[key["key"]] > 1:
+            keys_groups[key["key"]].append(key)
+
+    return list(keys_groups.values())
+
+
 def _get_withdrawal_credentials(chain_id: int):
     """
     @param chain_id: Network chain id
@@ -44,66 +90,256 @@ def _get_withdrawal_credentials(chain_id: int):
     return [bytes.fromhex(cred[2:]) for cred in WITHDRAWAL_CREDENTIALS[chain_id]]
 
 
-def validate_keys(w3: Web3, keys: List[OperatorKey]) -> List[OperatorKey]:
+def get_withdrawal_credentials(w3: Web3) -> bytes:
+    """
+    @param w3: Web3
+    @return: Actual withdrawal credentials from Lido contract
+    """
+    return LidoContract.getWithdrawalCredentials(w3)[""]
+
+
+def validate_keys(
+    w3: Web3, keys: List[OperatorKey], withdrawal_credentials: Optional[bytes] = None
+) -> List[OperatorKey]:
     """
     @param w3: Web3
     @param keys: List of keys to validate
+    @param withdrawal_credentials: Actual withdrawal credentials. Will be fetched from contract if not provided.
     @return: List of keys that are invalid
     """
     deposit_domain = compute_deposit_domain(GENESIS_FORK_VERSION[w3.eth.chain_id])
 
-    actual_credential = LidoContract.getWithdrawalCredentials(w3)[""]
+    actual_credential = (
+        get_withdrawal_credentials(w3)
+        if withdrawal_credentials is None
+        else withdrawal_credentials
+    )
     possible_credentials = _get_withdrawal_credentials(w3.eth.chain_id)
 
-    invalid_keys = []
+    # Validity depends only on pubkey, signature and "used" flag,
+    # so the same key that appears many times is verified once
+    key_identities = [_get_key_identity(key) for key in keys]
+    unique_keys = {}
+
+    for identity, key in zip(key_identities, keys):
+        unique_keys.setdefault(identity, key)
+
+    if not unique_keys:
+        return []
+
+    unique_keys_list = list(unique_keys.values())
+
+    # Values shared by all keys are bound once, so they are sent to worker once per chunk.
+    # Config is read here and not in worker: spawned processes import their own config with default values
+    validate_keys_list = partial(
+        _executor_validate_keys_list,
+        actual_credential=actual_credential,
+        possible_credentials=possible_credentials,
+        deposit_domain=deposit_domain,
+        batch_size=max(config.VALIDATE_BATCH_SIZE, 1),
+    )
 
-    key_params = [
-        (key, actual_credential, possible_credentials, deposit_domain) for key in keys
+    if len(unique_keys_list) < config.VALIDATE_MIN_KEYS_FOR_POOL:
+        results = [validate_keys_list(unique_keys_list)]
+    else:
+        workers = max(config.VALIDATE_POOL_MAX_WORKERS, 1)
+        chunk_size = -(-len(unique_keys_list) // workers)
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(
+                executor.map(
+                    validate_keys_list,
+                    [
+                        unique_keys_list[i : i + chunk_size]
+                        for i in range(0, len(unique_keys_list), chunk_size)
+                    ],
+                    timeout=config.VALIDATE_POOL_EXECUTOR_TIMEOUT,
+                )
+            )
+
+    validity = dict(zip(unique_keys, chain.from_iterable(results)))
+
+    invalid_keys = [
+        key for identity, key in zip(key_identities, keys) if not validity[identity]
     ]
 
-    with ProcessPoolExecutor() as executor:
-        results = executor.map(
-            _executor_validate_keys_list,
-            [key_params[i : i + 1000] for i in range(0, len(key_params), 1000)],
-            timeout=config.VALIDATE_POOL_EXECUTOR_TIMEOUT,
+    return invalid_keys
+
+
+def _get_key_identity(key: OperatorKey) -> Hashable:
+    if not _is_key_well_formed(key):
+        # Malformed keys are invalid anyway, there is nothing to deduplicate
+        return id(key)
+
+    return (
+        bytes(key["key"]),
+        bytes(key["depositSignature"]),
+        bool(key.get("used", False)),
+    )
+
+
+def _executor_validate_keys_list(
+    keys: List[OperatorKey],
+    actual_credential: bytes,
+    possible_credentials: List[bytes],
+    deposit_domain: bytes,
+    batch_size: int,
+) -> List[bool]:
+    """
+    @return: Validity of each key. Only flags are returned, so keys are not sent back from worker.
+    """
+    # Malformed keys are invalid anyway, so we don't spend time on hashing and pairing for them
+    decoded_keys = {}
+
+    for index, key in enumerate(keys):
+        if _is_key_well_formed(key):
+            decoded_key = decode_key(key["key"], key["depositSignature"])
+
+            if decoded_key is not None:
+                decoded_keys[index] = decoded_key
+
+    valid_indexes = _find_valid_indexes(
+        keys,
+        decoded_keys,
+        list(decoded_keys),
+        actual_credential,
+        deposit_domain,
+        batch_size,
+    )
+
+    # Used keys could be deposited with one of the previous withdrawal credentials.
+    # Each credential is checked in batches as well, for the keys that are still invalid.
+    for withdrawal_credential in possible_credentials:
+        unchecked_indexes = [
+            index
+            for index in decoded_keys
+            if index not in valid_indexes and keys[index].get("used", False)
+        ]
+
+        if not unchecked_indexes:
+            break
+
+        valid_indexes.update(
+            _find_valid_indexes(
+                keys,
+                decoded_keys,
+                unchecked_indexes,
+                withdrawal_credential,
+                deposit_domain,
+                batch_size,
+            )
         )
 
-        for result in results:
-            for is_valid, key in result:
-                if not is_valid:
-                    invalid_keys.append(key)
+    return [index in valid_indexes for index in range(len(keys))]
 
-    return invalid_keys
 
+def _is_key_well_formed(key: OperatorKey) -> bool:
+    pub_key = key.get("key")
+    signature = key.get("depositSignature")
 
-def _executor_validate_keys_list(keys: List[Tuple]) -> List[Tuple[bool, OperatorKey]]:
-    result = []
+    return (
+        isinstance(pub_key, VALID_TYPES)
+        and isinstance(signature, VALID_TYPES)
+        and len(pub_key) == PUBKEY_LENGTH
+        and len(signature) == SIGNATURE_LENGTH
+    )
 
-    # In each key -> actual_credential, possible_credential, deposit_domain
-    for key in keys:
-        result.append(
-            (
-                _executor_validate_key(key),
-                key[0],
+
+def _find_valid_indexes(
+    keys: List[OperatorKey],
+    decoded_keys: Dict[int, Tuple],
+    indexes: List[int],
+    withdrawal_credential: bytes,
+    deposit_domain: bytes,
+    batch_size: int,
+) -> Set[int]:
+    """
+    Check signatures of keys[indexes] against withdrawal_credential.
+    Every message is hashed to curve once and reused by all batches that include it.
+    """
+    points = [decoded_keys[index] for index in indexes]
+    message_points = [
+        hash_message(
+            _compute_deposit_signing_root(
+                keys[index], withdrawal_credential, deposit_domain
             )
         )
+        for index in indexes
+    ]
 
-    return result
+    invalid_positions = set(_find_invalid_indexes(points, message_points, batch_size))
 
+    return {
+        index
+        for position, index in enumerate(indexes)
+        if position not in invalid_positions
+    }
 
-def _executor_validate_key(data: Tuple) -> bool:
-    key, actual_credential, possible_credential, deposit_domain = data
 
-    is_valid = validate_key(key, actual_credential, deposit_domain)
+def _find_invalid_indexes(
+    points: List[Tuple], message_points: List, batch_size: int
+) -> List[int]:
+    """
+    Verify keys by batches of batch_size. If batch fails - bisect it to find invalid keys.
+    In common case (all keys are valid) there will be one pairing check per batch.
+    When a lot of keys are invalid, bisection costs more than it saves, so keys are checked one by one.
+    """
+    invalid_indexes = []
 
-    if not is_valid and key.get("used", False):
-        for wc in possible_credential:
-            is_valid = validate_key(key, wc, deposit_domain)
+    for start in range(0, len(points), batch_size):
+        end = min(start + batch_size, len(points))
 
-            if is_valid:
-                break
+        if len(invalid_indexes) * DENSE_FAILURES_RATIO > start:
+            invalid_indexes.extend(
+                _find_invalid_indexes_one_by_one(points, message_points, start, end)
+            )
+        elif not verify_decoded_batch(points[start:end], message_points[start:end]):
+            invalid_indexes.extend(
+                _bisect_invalid_indexes(points, message_points, start, end)
+            )
 
-    return is_valid
+    return invalid_indexes
+
+
+def _bisect_invalid_indexes(
+    points: List[Tuple], message_points: List, start: int, end: int
+) -> List[int]:
+    """Find invalid keys in range that is known to have at least one of them."""
+    if end - start <= BISECT_MIN_SIZE:
+        return _find_invalid_indexes_one_by_one(points, message_points, start, end)
+
+    middle = (start + end) // 2
+
+    if verify_decoded_batch(points[start:middle], message_points[start:middle]):
+        # Left half is valid, so invalid keys are in the right one
+        return _bisect_invalid_indexes(points, message_points, middle, end)
+
+    invalid_indexes = _bisect_invalid_indexes(points, message_points, start, middle)
+
+    if not verify_decoded_batch(points[middle:end], message_points[middle:end]):
+        invalid_indexes.extend(
+            _bisect_invalid_indexes(points, message_points, middle, end)
+        )
+
+    return invalid_indexes
+
+
+def _find_invalid_indexes_one_by_one(
+    points: List[Tuple], message_points: List, start: int, end: int
+) -> List[int]:
+    return [
+        index
+        for index in range(start, end)
+        if not verify_decoded(points[index], message_points[index])
+    ]
+
+
+def _compute_deposit_signing_root(
+    key: OperatorKey, withdrawal_credential: bytes, deposit_domain: bytes
+) -> bytes:
+    return compute_deposit_signing_root(
+        key["key"], withdrawal_credential, ETH32_ROOT, deposit_domain
+    )
 
 
 def validate_key(
@@ -115,17 +351,13 @@ def validate_key(
     @param deposit_domain: Magic bytes.
     @return: Bool - Valid or Invalid this key
     """
+    if not _is_key_well_formed(key):
+        return False
+
     pub_key = key["key"]
     signature = key["depositSignature"]
 
-    ETH32 = 32 * 10**9
-    deposit_message = DepositMessage(
-        pubkey=key["key"],
-        withdrawal_credentials=withdrawal_credential,
-        amount=ETH32,
-    )
-
-    message = compute_signing_root(deposit_message, deposit_domain)
+    message = _compute_deposit_signing_root(key, withdrawal_credential, deposit_domain)
     is_valid = verify(pub_key, message, signature)
 
     if is_valid:
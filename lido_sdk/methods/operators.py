@@ -12,7 +12,15 @@ def get_operators_indexes(w3: Web3) -> List[int]:
     @return: Node operators count
     """
     operators_count = NodeOpsContract.getNodeOperatorsCount(w3)[""]
-    return [x for x in range(operators_count)]
+    return list(range(operators_count))
+
+
+def get_keys_op_index(w3: Web3) -> int:
+    """
+    @param w3: Web3 instance
+    @return: Registry nonce. It is changed on every keys add or remove.
+    """
+    return NodeOpsContract.getKeysOpIndex(w3)[""]
 
 
 def get_operators_data(w3: Web3, operators_index_list: List[int]) -> List[Operator]:
@@ -42,30 +50,13 @@ def get_operators_keys(w3: Web3, operators: List[Operator]) -> List[OperatorKey]
     @param operators: List of method's details from get_operators_data. But we need only `index` and `totalSigningKeys`.
     @return: List of dicts (OperatorKey)
     """
-    args_list = []
-
-    if not operators:
-        return []
-
-    for args in _index_generator(operators):
-        args_list.append(args)
-
-    if not args_list:
-        return []
-
-    keys = NodeOpsContract.getSigningKey_multicall(w3, args_list)
-
-    for key, (operator_index, key_index) in zip(keys, _index_generator(operators)):
-        key["index"] = key_index
-        key["operator_index"] = operator_index
-
-    return keys
-
+    args_list = [
+        (operator["index"], key_index)
+        for operator in operators
+        for key_index in range(operator["totalSigningKeys"])
+    ]
 
-def _index_generator(operators):
-    for operator in operators:
-        for key_index in range(operator["totalSigningKeys"]):
-            yield operator["index"], key_index
+    return get_keys_by_indexes(w3, args_list)
 
 
 def get_keys_by_indexes(
@@ -1,17 +1,48 @@
+from multicall import Call
 from web3 import Web3
 
 from lido_sdk.contract import LidoContract
+from lido_sdk.contract.execute_contract import execute_multicall
+from lido_sdk.eth_multicall.multicall_address import MULTICALL_ADDRESSES
 
 
 def get_status(w3: Web3):
+    multicall_address = MULTICALL_ADDRESSES[w3.eth.chain_id]
+
+    # All values are read in one aggregate3 call, so they are taken from the same block in one request
+    (
+        is_stopped,
+        total_pooled_ether,
+        withdrawal_credentials,
+        buffered_ether,
+        fee,
+        fee_distribution,
+        beacon_stat,
+        last_block,
+        last_blocktime,
+    ) = execute_multicall(
+        w3,
+        [
+            LidoContract.create_call(w3, "isStopped"),
+            LidoContract.create_call(w3, "getTotalPooledEther"),
+            LidoContract.create_call(w3, "getWithdrawalCredentials"),
+            LidoContract.create_call(w3, "getBufferedEther"),
+            LidoContract.create_call(w3, "getFee"),
+            LidoContract.create_call(w3, "getFeeDistribution"),
+            LidoContract.create_call(w3, "getBeaconStat"),
+            Call(multicall_address, "getBlockNumber()(uint256)", _w3=w3),
+            Call(multicall_address, "getCurrentBlockTimestamp()(uint256)", _w3=w3),
+        ],
+    )
+
     return {
-        "isStopped": LidoContract.isStopped(w3)[""],
-        "totalPooledEther": LidoContract.getTotalPooledEther(w3)[""],
-        "withdrawalCredentials": LidoContract.getWithdrawalCredentials(w3)[""],
-        "bufferedEther": LidoContract.getBufferedEther(w3)[""],
-        **LidoContract.getFee(w3),
-        **LidoContract.getFeeDistribution(w3),
-        **LidoContract.getBeaconStat(w3),
-        "last_block": w3.eth.getBlock("latest")["number"],
-        "last_blocktime": w3.eth.getBlock("latest")["timestamp"],
+        "isStopped": is_stopped[""],
+        "totalPooledEther": total_pooled_ether[""],
+        "withdrawalCredentials": withdrawal_credentials[""],
+        "bufferedEther": buffered_ether[""],
+        **fee,
+        **fee_distribution,
+        **beacon_stat,
+        "last_block": last_block,
+        "last_blocktime": last_blocktime,
     }
@@ -69,6 +69,23 @@ OPERATORS_KEYS = [
     },
 ]
 
+
+def make_operator_key(
+    index: int = 0,
+    operator_index: int = 0,
+    used: bool = False,
+    key: bytes = OPERATORS_KEYS[1]["key"],
+    deposit_signature: bytes = OPERATORS_KEYS[1]["depositSignature"],
+) -> dict:
+    return {
+        "index": index,
+        "operator_index": operator_index,
+        "key": key,
+        "depositSignature": deposit_signature,
+        "used": used,
+    }
+
+
 VALID_KEY_BYTEARRAY = {
     "pubkey": bytearray(
         b"\xad\xd9\xa5\x0b\xc6\xde5B\xc8\x81\xe3e\x07\x99JRh5&\xf7]\xdc\xef,"
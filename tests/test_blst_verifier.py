@@ -1,4 +1,5 @@
 from lido_sdk.blstverify import verify
+from lido_sdk.blstverify.verifier import decode_key, hash_message, verify_decoded_batch
 from tests.fixtures import (
     VALID_KEY_BYTEARRAY,
     VALID_KEY_BYTES,
@@ -145,3 +146,41 @@ def test_invalid_bytes_arguments():
     res = verify(pubkey, signing_root, signature)
 
     assert res is False
+
+
+def _verify_decoded_batch(keys) -> bool:
+    return verify_decoded_batch(
+        [decode_key(key["pubkey"], key["signature"]) for key in keys],
+        [hash_message(key["signing_root"]) for key in keys],
+    )
+
+
+def test_valid_bls_batch():
+    res = _verify_decoded_batch([VALID_KEY_BYTES, VALID_KEY_BYTEARRAY, VALID_KEY_BYTES])
+
+    assert res is True
+
+
+def test_invalid_bls_batch():
+    wrong_message_key = {
+        **VALID_KEY_BYTES,
+        "signing_root": INVALID_KEY_BYTES["signing_root"],
+    }
+
+    res = _verify_decoded_batch(
+        [VALID_KEY_BYTES, wrong_message_key, VALID_KEY_BYTEARRAY]
+    )
+
+    assert res is False
+
+
+def test_decode_invalid_key():
+    res = decode_key(INVALID_KEY_BYTES["pubkey"], INVALID_KEY_BYTES["signature"])
+
+    assert res is None
+
+
+def test_empty_bls_batch():
+    res = verify_decoded_batch([], [])
+
+    assert res is True
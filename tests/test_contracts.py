@@ -31,13 +31,16 @@ class ContractTest(MockTestCase):
         )
         contract_multicall = self.mocker.patch(
             "multicall.Call.__call__",
-            return_value=(
-                2,
-                [
+            return_value=[
+                (
+                    True,
                     b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\r",
+                ),
+                (
+                    True,
                     b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\r",
-                ],
-            ),
+                ),
+            ],
         )
         self.mocker.patch(
             "web3.eth.Eth.chain_id", return_value=1, new_callable=PropertyMock
@@ -1,20 +1,26 @@
-import copy
-from unittest.mock import PropertyMock
+from unittest.mock import PropertyMock, patch
 
 from web3 import Web3
 
-from lido_sdk import Lido
+from lido_sdk import Lido, config
+from lido_sdk.methods import keys as keys_methods
 from lido_sdk.methods import (
     get_operators_indexes,
     get_operators_data,
     get_operators_keys,
     validate_keys,
     find_duplicated_keys,
+    find_duplicated_keys_groups,
 )
-from tests.fixtures import OPERATORS_DATA, OPERATORS_KEYS
+from tests.fixtures import OPERATORS_DATA, OPERATORS_KEYS, make_operator_key
 from tests.utils import get_mainnet_provider, MockTestCase
 
 
+def _encode_words(*values: int) -> bytes:
+    """ABI encoding of static values (bool and uint) is 32 bytes big-endian word per value"""
+    return b"".join(int(value).to_bytes(32, "big") for value in values)
+
+
 class LidoE2ETest(MockTestCase):
     def test_main_flow_methods(self):
         w3 = get_mainnet_provider()
@@ -32,12 +38,22 @@ class LidoE2ETest(MockTestCase):
 
 
 class OperatorTest(MockTestCase):
-    def setUp(self) -> None:
-        self.mocker.patch(
+    @classmethod
+    def setUpClass(cls) -> None:
+        # chain_id patch is shared by all tests in class.
+        # self.mocker exists only inside a test, so unittest patch is used here.
+        cls._chain_id_patch = patch(
             "web3.eth.Eth.chain_id", return_value=1, new_callable=PropertyMock
         )
-        self.w3 = Web3()
+        cls._chain_id_patch.start()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._chain_id_patch.stop()
 
+    def setUp(self) -> None:
+        # Lido caches chain_id in Web3 instance, so each test has its own one
+        self.w3 = Web3()
         self.lido = Lido(self.w3)
 
     def test_get_operators_indexes(self):
@@ -47,7 +63,7 @@ class OperatorTest(MockTestCase):
         )
 
         operator_indexes = self.lido.get_operators_indexes()
-        self.assertListEqual([x for x in range(5)], operator_indexes)
+        self.assertListEqual(list(range(5)), operator_indexes)
 
     def test_get_operators_data(self):
         """We are checking that indexes are assigned correctly"""
@@ -75,6 +91,10 @@ class OperatorTest(MockTestCase):
         self.assertEqual(1, operators_data[1]["index"])
 
     def test_get_operators_keys(self):
+        self.mocker.patch(
+            "lido_sdk.contract.load_contract.NodeOpsContract.getKeysOpIndex",
+            return_value={"": 1},
+        )
         self.mocker.patch(
             "lido_sdk.contract.load_contract.NodeOpsContract.getSigningKey_multicall",
             return_value=OPERATORS_KEYS,
@@ -95,9 +115,13 @@ class OperatorTest(MockTestCase):
             {"index": 2, "operator_index": 1},
         ]
 
-        for expected_key, key in zip(expected_indexes, keys):
-            self.assertEqual(expected_key["index"], key["index"])
-            self.assertEqual(expected_key["operator_index"], key["operator_index"])
+        self.assertListEqual(
+            expected_indexes,
+            [
+                {"index": key["index"], "operator_index": key["operator_index"]}
+                for key in keys
+            ],
+        )
 
         """Input is None"""
         self.lido.operators = OPERATORS_DATA
@@ -130,6 +154,132 @@ class OperatorTest(MockTestCase):
         invalid_keys = self.lido.validate_keys()
         self.assertEqual(2, len(invalid_keys))
 
+    def test_validate_malformed_keys(self):
+        self.mocker.patch(
+            "lido_sdk.contract.load_contract.LidoContract.getWithdrawalCredentials",
+            return_value={
+                "": b"\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb9\xd7\x93Hx\xb5\xfb\x96\x10\xb3\xfe\x8a^D\x1e\x8f\xad~)?"
+            },
+        )
+
+        short_key = {**OPERATORS_KEYS[2], "key": OPERATORS_KEYS[2]["key"][:47]}
+        empty_signature_key = {**OPERATORS_KEYS[2], "depositSignature": b""}
+
+        invalid_keys = self.lido.validate_keys(
+            [short_key, OPERATORS_KEYS[2], empty_signature_key]
+        )
+        self.assertListEqual([short_key, empty_signature_key], invalid_keys)
+
+    def test_validate_keys_in_process_pool(self):
+        self.mocker.patch(
+            "lido_sdk.contract.load_contract.LidoContract.getWithdrawalCredentials",
+            return_value={
+                "": b"\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb9\xd7\x93Hx\xb5\xfb\x96\x10\xb3\xfe\x8a^D\x1e\x8f\xad~)?"
+            },
+        )
+        self.mocker.patch.object(config, "VALIDATE_MIN_KEYS_FOR_POOL", 0)
+        self.mocker.patch.object(config, "VALIDATE_POOL_MAX_WORKERS", 2)
+        self.mocker.patch.object(config, "VALIDATE_BATCH_SIZE", 2)
+        process_pool = self.mocker.spy(keys_methods, "ProcessPoolExecutor")
+
+        short_key = {**OPERATORS_KEYS[2], "key": OPERATORS_KEYS[2]["key"][:47]}
+        keys = [
+            OPERATORS_KEYS[2],
+            OPERATORS_KEYS[0],
+            short_key,
+            OPERATORS_KEYS[2],
+            OPERATORS_KEYS[1],
+            OPERATORS_KEYS[0],
+            OPERATORS_KEYS[2],
+        ]
+
+        invalid_keys = self.lido.validate_keys(keys)
+        self.assertListEqual(
+            [OPERATORS_KEYS[0], short_key, OPERATORS_KEYS[1], OPERATORS_KEYS[0]],
+            invalid_keys,
+        )
+        process_pool.assert_called_once_with(max_workers=2)
+
+        """Input is an empty array"""
+        self.assertListEqual([], self.lido.validate_keys([]))
+
+    def test_validate_keys_bisects_failed_batch(self):
+        self.mocker.patch(
+            "lido_sdk.contract.load_contract.LidoContract.getWithdrawalCredentials",
+            return_value={
+                "": b"\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb9\xd7\x93Hx\xb5\xfb\x96\x10\xb3\xfe\x8a^D\x1e\x8f\xad~)?"
+            },
+        )
+        self.mocker.patch.object(config, "VALIDATE_BATCH_SIZE", 4)
+        self.mocker.patch.object(keys_methods, "BISECT_MIN_SIZE", 1)
+        bisect = self.mocker.spy(keys_methods, "_bisect_invalid_indexes")
+
+        # Each half of the batch has one invalid key
+        keys = [
+            OPERATORS_KEYS[4],
+            OPERATORS_KEYS[1],
+            {**OPERATORS_KEYS[4], "used": True},
+            {**OPERATORS_KEYS[2], "used": False},
+        ]
+
+        invalid_keys = self.lido.validate_keys(keys)
+        self.assertListEqual([keys[1], keys[3]], invalid_keys)
+
+        bisected_ranges = [call.args[2:] for call in bisect.call_args_list]
+        self.assertIn((0, 2), bisected_ranges)
+        self.assertIn((2, 4), bisected_ranges)
+
+    def test_validate_keys_one_by_one_when_most_keys_invalid(self):
+        self.mocker.patch(
+            "lido_sdk.contract.load_contract.LidoContract.getWithdrawalCredentials",
+            return_value={
+                "": b"\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb9\xd7\x93Hx\xb5\xfb\x96\x10\xb3\xfe\x8a^D\x1e\x8f\xad~)?"
+            },
+        )
+        self.mocker.patch.object(config, "VALIDATE_BATCH_SIZE", 2)
+        one_by_one = self.mocker.spy(keys_methods, "_find_invalid_indexes_one_by_one")
+        batch = self.mocker.spy(keys_methods, "verify_decoded_batch")
+
+        keys = [
+            OPERATORS_KEYS[1],
+            {**OPERATORS_KEYS[2], "used": False},
+            {**OPERATORS_KEYS[3], "used": False},
+            {
+                **OPERATORS_KEYS[4],
+                "depositSignature": OPERATORS_KEYS[2]["depositSignature"],
+            },
+            OPERATORS_KEYS[4],
+        ]
+
+        invalid_keys = self.lido.validate_keys(keys)
+        self.assertListEqual(keys[:4], invalid_keys)
+
+        # First batch has only invalid keys, so the rest are checked without batches
+        batch.assert_called_once()
+        self.assertListEqual(
+            [(0, 2), (2, 4), (4, 5)],
+            [call.args[2:] for call in one_by_one.call_args_list],
+        )
+
+    def test_withdrawal_credentials_cache(self):
+        credentials_call = self.mocker.patch(
+            "lido_sdk.contract.load_contract.LidoContract.getWithdrawalCredentials",
+            return_value={
+                "": b"\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb9\xd7\x93Hx\xb5\xfb\x96\x10\xb3\xfe\x8a^D\x1e\x8f\xad~)?"
+            },
+        )
+
+        self.lido.validate_keys(OPERATORS_KEYS)
+        self.lido.validate_keys(OPERATORS_KEYS)
+        self.assertEqual(1, credentials_call.call_count)
+
+        self.lido.get_withdrawal_credentials(fresh=True)
+        self.assertEqual(2, credentials_call.call_count)
+
+        self.lido.clear_cache()
+        self.lido.validate_keys(OPERATORS_KEYS)
+        self.assertEqual(3, credentials_call.call_count)
+
     def test_find_duplicated_keys(self):
         duplicates = self.lido.find_duplicated_keys(
             [*OPERATORS_KEYS, OPERATORS_KEYS[0]]
@@ -159,7 +309,28 @@ class OperatorTest(MockTestCase):
         self.assertEqual(1, len(duplicates))
         self.assertEqual(duplicates[0][0]["key"], duplicates[0][1]["key"])
 
+    def test_find_duplicated_keys_groups(self):
+        groups = find_duplicated_keys_groups(
+            [*OPERATORS_KEYS, OPERATORS_KEYS[0], OPERATORS_KEYS[0], OPERATORS_KEYS[2]]
+        )
+
+        self.assertEqual(2, len(groups))
+        self.assertListEqual([OPERATORS_KEYS[0]] * 3, groups[0])
+        self.assertListEqual([OPERATORS_KEYS[2]] * 2, groups[1])
+
+        duplicates = find_duplicated_keys(
+            [*OPERATORS_KEYS, OPERATORS_KEYS[0], OPERATORS_KEYS[0]]
+        )
+        self.assertEqual(2, len(duplicates))
+
+        self.assertListEqual([], find_duplicated_keys_groups(OPERATORS_KEYS))
+        self.assertListEqual([], find_duplicated_keys_groups([]))
+
     def test_keys_update(self):
+        self.mocker.patch(
+            "lido_sdk.contract.load_contract.NodeOpsContract.getKeysOpIndex",
+            return_value={"": 1},
+        )
         self.mocker.patch(
             "lido_sdk.contract.load_contract.NodeOpsContract.getNodeOperatorsCount",
             return_value={"": 5},
@@ -177,26 +348,28 @@ class OperatorTest(MockTestCase):
         self.lido.get_operators_data()
         self.lido.get_operators_keys()
 
-        operators = copy.deepcopy(OPERATORS_DATA)
+        operators = [dict(operator) for operator in OPERATORS_DATA]
         operators[0]["totalSigningKeys"] += 2
         operators[0]["usedSigningKeys"] += 1
         operators[1]["totalSigningKeys"] -= 1
 
+        self.mocker.patch(
+            "lido_sdk.contract.load_contract.NodeOpsContract.getKeysOpIndex",
+            return_value={"": 2},
+        )
         self.mocker.patch(
             "lido_sdk.contract.load_contract.NodeOpsContract.getNodeOperator_multicall",
             return_value=operators,
         )
 
-        keys = copy.deepcopy(
-            [
-                OPERATORS_KEYS[1].copy(),
-                OPERATORS_KEYS[1].copy(),
-                OPERATORS_KEYS[1].copy(),
-            ]
-        )
-        keys[0]["used"] = True
-        keys[1]["index"] += 1
-        keys[2]["index"] += 2
+        keys = [
+            make_operator_key(
+                index=OPERATORS_KEYS[1]["index"] + shift,
+                operator_index=OPERATORS_KEYS[1]["operator_index"],
+                used=shift == 0,
+            )
+            for shift in range(3)
+        ]
         keys_list_call = self.mocker.patch(
             "lido_sdk.contract.load_contract.NodeOpsContract.getSigningKey_multicall",
             return_value=keys,
@@ -219,7 +392,108 @@ class OperatorTest(MockTestCase):
         )
         self.assertTrue(key["used"])
 
+    def test_keys_update_skips_unchanged_operators(self):
+        self.mocker.patch(
+            "lido_sdk.contract.load_contract.NodeOpsContract.getKeysOpIndex",
+            return_value={"": 1},
+        )
+        self.mocker.patch(
+            "lido_sdk.contract.load_contract.NodeOpsContract.getNodeOperatorsCount",
+            return_value={"": 2},
+        )
+        self.mocker.patch(
+            "lido_sdk.contract.load_contract.NodeOpsContract.getNodeOperator_multicall",
+            return_value=OPERATORS_DATA,
+        )
+        self.mocker.patch(
+            "lido_sdk.contract.load_contract.NodeOpsContract.getSigningKey_multicall",
+            return_value=OPERATORS_KEYS,
+        )
+
+        self.lido.get_operators_indexes()
+        self.lido.get_operators_data()
+        self.lido.get_operators_keys()
+
+        operators = [dict(operator) for operator in OPERATORS_DATA]
+        # Unused key was deposited (operator 0), operator 1 wasn't changed.
+        # Nonce is the same - no keys were added or removed.
+        operators[0]["usedSigningKeys"] += 1
+
+        self.mocker.patch(
+            "lido_sdk.contract.load_contract.NodeOpsContract.getNodeOperator_multicall",
+            return_value=operators,
+        )
+
+        keys_list_call = self.mocker.patch(
+            "lido_sdk.contract.load_contract.NodeOpsContract.getSigningKey_multicall",
+            return_value=[make_operator_key(index=1, used=True)],
+        )
+
+        self.lido.update_keys()
+
+        # Only previously unused keys of operator 0 were fetched
+        self.assertListEqual(keys_list_call.call_args[0][1], [(0, 1)])
+
+        # Unused key of operator 1 is kept
+        self.assertEqual(len(self.lido.keys), 5)
+        self.assertEqual(
+            3, len([key for key in self.lido.keys if key["operator_index"] == 1])
+        )
+
+    def test_keys_update_when_keys_replaced(self):
+        self.mocker.patch(
+            "lido_sdk.contract.load_contract.NodeOpsContract.getKeysOpIndex",
+            return_value={"": 1},
+        )
+        self.mocker.patch(
+            "lido_sdk.contract.load_contract.NodeOpsContract.getNodeOperatorsCount",
+            return_value={"": 2},
+        )
+        self.mocker.patch(
+            "lido_sdk.contract.load_contract.NodeOpsContract.getNodeOperator_multicall",
+            return_value=OPERATORS_DATA,
+        )
+        self.mocker.patch(
+            "lido_sdk.contract.load_contract.NodeOpsContract.getSigningKey_multicall",
+            return_value=OPERATORS_KEYS,
+        )
+
+        self.lido.get_operators_indexes()
+        self.lido.get_operators_data()
+        self.lido.get_operators_keys()
+
+        # Each operator removed unused key and added another one.
+        # Keys counters are the same, but nonce was changed.
+        self.mocker.patch(
+            "lido_sdk.contract.load_contract.NodeOpsContract.getKeysOpIndex",
+            return_value={"": 3},
+        )
+
+        new_keys = [
+            make_operator_key(index=1, operator_index=0, key=OPERATORS_KEYS[2]["key"]),
+            make_operator_key(index=2, operator_index=1, key=OPERATORS_KEYS[0]["key"]),
+        ]
+        keys_list_call = self.mocker.patch(
+            "lido_sdk.contract.load_contract.NodeOpsContract.getSigningKey_multicall",
+            return_value=new_keys,
+        )
+
+        self.lido.update_keys()
+
+        # Unused keys of both operators were refetched
+        self.assertListEqual(keys_list_call.call_args[0][1], [(0, 1), (1, 2)])
+
+        self.assertEqual(len(self.lido.keys), 5)
+        self.assertIn(new_keys[0], self.lido.keys)
+        self.assertIn(new_keys[1], self.lido.keys)
+        self.assertNotIn(OPERATORS_KEYS[1], self.lido.keys)
+        self.assertNotIn(OPERATORS_KEYS[4], self.lido.keys)
+
     def test_keys_update_when_unused_keys_removed(self):
+        self.mocker.patch(
+            "lido_sdk.contract.load_contract.NodeOpsContract.getKeysOpIndex",
+            return_value={"": 1},
+        )
         self.mocker.patch(
             "lido_sdk.contract.load_contract.NodeOpsContract.getNodeOperatorsCount",
             return_value={"": 2},
@@ -237,7 +511,7 @@ class OperatorTest(MockTestCase):
         self.lido.get_operators_data()
         self.lido.get_operators_keys()
 
-        operators = copy.deepcopy(OPERATORS_DATA)
+        operators = [dict(operator) for operator in OPERATORS_DATA]
         # All unused keys were removed (operator 0)
         # All unused keys were removed (operator 1)
         operators[0]["totalSigningKeys"] = 1
@@ -245,6 +519,10 @@ class OperatorTest(MockTestCase):
         operators[1]["totalSigningKeys"] = 2
         operators[1]["usedSigningKeys"] = 2
 
+        self.mocker.patch(
+            "lido_sdk.contract.load_contract.NodeOpsContract.getKeysOpIndex",
+            return_value={"": 2},
+        )
         self.mocker.patch(
             "lido_sdk.contract.load_contract.NodeOpsContract.getNodeOperator_multicall",
             return_value=operators,
@@ -275,3 +553,44 @@ class OperatorTest(MockTestCase):
 
         self.assertEqual(invalid_keys[0], OPERATORS_KEYS[0])
         self.assertEqual(invalid_keys[1], OPERATORS_KEYS[1])
+
+    def test_get_status(self):
+        # Outputs of all calls are returned by one aggregate3 call in the same order
+        aggregate_call = self.mocker.patch(
+            "multicall.Call.__call__",
+            return_value=[
+                (True, _encode_words(False)),
+                (True, _encode_words(100)),
+                (True, b"\x01" * 32),
+                (True, _encode_words(10)),
+                (True, _encode_words(1000)),
+                (True, _encode_words(0, 5000, 5000)),
+                (True, _encode_words(3, 2, 64)),
+                (True, _encode_words(12345)),
+                (True, _encode_words(1600000000)),
+            ],
+        )
+
+        status = self.lido.get_status()
+
+        self.assertDictEqual(
+            {
+                "isStopped": False,
+                "totalPooledEther": 100,
+                "withdrawalCredentials": b"\x01" * 32,
+                "bufferedEther": 10,
+                "totalFee": 1000,
+                "treasuryFeeBasisPoints": 0,
+                "insuranceFeeBasisPoints": 5000,
+                "operatorsFeeBasisPoints": 5000,
+                "depositedValidators": 3,
+                "beaconValidators": 2,
+                "beaconBalance": 64,
+                "last_block": 12345,
+                "last_blocktime": 1600000000,
+            },
+            status,
+        )
+        # All values are taken from the same block in one request
+        aggregate_call.assert_called_once()
+        self.assertEqual(9, len(aggregate_call.call_args[0][0][0]))
@@ -9,13 +9,16 @@ from lido_sdk import config
 def _get_broken_endpoint_generator(retries_to_success):
     for i in range(retries_to_success):
         if i == retries_to_success - 1:
-            yield (
-                13146382,
+            yield [
                 (
+                    True,
                     b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\r",
+                ),
+                (
+                    True,
                     b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\r",
                 ),
-            )
+            ]
         else:
             yield ValueError(
                 {"code": -32000, "message": "execution aborted (timeout = 5s)"}
@@ -0,0 +1,29 @@
+from lido_sdk.eth2deposit.ssz import (
+    DepositMessage,
+    compute_deposit_amount_root,
+    compute_deposit_domain,
+    compute_deposit_signing_root,
+    compute_signing_root,
+)
+from lido_sdk.network.type import GENESIS_FORK_VERSION, Network
+from tests.fixtures import OPERATORS_KEYS
+
+
+def test_deposit_signing_root_matches_ssz():
+    amount = 32 * 10**9
+    withdrawal_credentials = b"\x01" + b"\x00" * 11 + b"\xb9" * 20
+    domain = compute_deposit_domain(GENESIS_FORK_VERSION[Network.Mainnet])
+    amount_root = compute_deposit_amount_root(amount)
+
+    for key in OPERATORS_KEYS:
+        deposit_message = DepositMessage(
+            pubkey=key["key"],
+            withdrawal_credentials=withdrawal_credentials,
+            amount=amount,
+        )
+
+        assert compute_signing_root(
+            deposit_message, domain
+        ) == compute_deposit_signing_root(
+            key["key"], withdrawal_credentials, amount_root, domain
+        )